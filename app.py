@@ -1,9 +1,34 @@
 from flask import Flask, request, render_template
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache, cached
+from typing import Optional
+from urllib.parse import urlparse
+import atexit
+import functools
+import os
+import queue
 import pandas as pd
+import requests
+import threading
 import time
 
+try:
+    import pyarrow  # noqa: F401
+    STR_DTYPE = "string[pyarrow]"  # Arrow buffers instead of one Python object per cell
+except ImportError:
+    STR_DTYPE = "string"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # lxml fallback, see fetch_page_text
+    LexborHTMLParser = None
+
 app = Flask(__name__)
 
 # -----------------------------------
@@ -16,20 +41,102 @@ PAGES = [
   
 ]
 
+# -----------------------------------
+# Shared HTTP session (keep-alive, pooled connections)
+# -----------------------------------
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Hosts whose search pages are server-rendered, so plain HTTP is enough
+STATIC_HOSTS = {"www.ebay.com"}
+
+SESSION = requests.Session()
+SESSION.headers.update(DEFAULT_HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+
+# -----------------------------------
+# Per-host rate limit (at most ~2 req/s to the same site)
+# -----------------------------------
+HOST_MIN_INTERVAL_S = 0.5
+
+_host_lock = threading.Lock()
+_host_next_slot = {}
+
+def throttle_host(host: str) -> None:
+    with _host_lock:
+        now = time.monotonic()
+        slot = max(now, _host_next_slot.get(host, now))
+        _host_next_slot[host] = slot + HOST_MIN_INTERVAL_S
+    if slot > now:
+        time.sleep(slot - now)
+
 # -----------------------------------
 # Robust CSV Reader (handles tabs)
 # -----------------------------------
-def read_table(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path, engine="python", on_bad_lines="skip")
-    if len(df.columns) == 1 and "\t" in df.columns[0]:
-        df = pd.read_csv(path, sep="\t", engine="python", on_bad_lines="skip")
-    if len(df.columns) == 1:
-        df = pd.read_csv(path, sep=None, engine="python", on_bad_lines="skip")
+def read_table(path: str, columns: Optional[dict] = None) -> pd.DataFrame:
+    # Pick the delimiter from the header line so the file is parsed once, with the C engine
+    with open(path, encoding="utf-8") as f:
+        header = f.readline()
+    if "\t" in header:
+        sep, engine = "\t", "c"
+    elif "," in header:
+        sep, engine = ",", "c"
+    else:
+        sep, engine = None, "python"
+
+    # Only parse the columns we use ({header name: dtype}), skipping type inference
+    usecols = dtype = None
+    if columns:
+        raw = pd.read_csv(path, sep=sep, engine=engine, nrows=0).columns
+        wanted = [c for c in raw if c.strip() in columns]
+        # With no match, read every column so the caller's error can list the real headers
+        if wanted:
+            usecols = wanted
+            dtype = {c: columns[c.strip()] for c in wanted}
+
+    df = pd.read_csv(path, sep=sep, engine=engine, usecols=usecols, dtype=dtype, on_bad_lines="skip")
     df.columns = [c.strip() for c in df.columns]
     return df
 
-def load_data():
-    ratings = read_table("Rating.csv")
+# -----------------------------------
+# Name normalization (trim, lower-case, collapse inner whitespace)
+# -----------------------------------
+def norm(s: str) -> str:
+    return " ".join(str(s).split()).lower()
+
+# Same rule as norm(): whitespace-split (Unicode-aware, NBSP included) and re-join.
+# A \s regex would run on RE2 for Arrow-backed columns, which only knows ASCII whitespace.
+def _norm_series(s: pd.Series) -> pd.Series:
+    return s.str.split().str.join(" ").str.lower()
+
+# Normalized header spellings, for spotting header lines repeated inside the data
+# (Rating.csv has a "scientific_name\tcommon_name\trating" line mid-file)
+HEADER_NAME_NORMS = {"scientific name", "scientific_name"}
+
+RATINGS_CSV = "Rating.csv"
+CCR_CSV = "CCR4500.csv"
+
+RATINGS_COLUMNS = {
+    "Scientific Name": STR_DTYPE,
+    "Scientific name": STR_DTYPE,
+    "Common Name": STR_DTYPE,
+    "Common Name(s)": STR_DTYPE,
+    "Common name(s)": STR_DTYPE,
+    "CDFA Pest Rating": "category",
+}
+CCR_COLUMNS = {
+    "Scientific Name": STR_DTYPE,
+    "Scientific name": STR_DTYPE,
+}
+
+# Parsed once per file version; editing a CSV changes its mtime and busts the cache.
+# Callers must treat the returned frame/set as read-only.
+@functools.lru_cache(maxsize=1)
+def _load_data_cached(ratings_mtime: float, ccr_mtime: float):
+    ratings = read_table(RATINGS_CSV, RATINGS_COLUMNS)
     ratings = ratings.rename(columns={
         "Scientific Name": "scientific_name",
         "Scientific name": "scientific_name",
@@ -45,11 +152,16 @@ def load_data():
     if "rating" not in ratings.columns:
         ratings["rating"] = "N/A"
 
-    ratings["common_name"] = ratings["common_name"].astype(str).str.strip()
-    ratings["scientific_name"] = ratings["scientific_name"].astype(str).str.strip()
-    ratings["rating"] = ratings["rating"].astype(str).str.strip()
+    # Columns are already "string" dtype; blank cells come back as <NA>
+    ratings["common_name"] = ratings["common_name"].fillna("").str.strip()
+    ratings["scientific_name"] = ratings["scientific_name"].fillna("").str.strip()
+    ratings["common_name_norm"] = _norm_series(ratings["common_name"])
+    ratings["scientific_name_norm"] = _norm_series(ratings["scientific_name"])
+    # Drop repeated header lines before deriving the rating categories from the data
+    ratings = ratings.drop(ratings.index[ratings["scientific_name_norm"].isin(HEADER_NAME_NORMS)])
+    ratings["rating"] = ratings["rating"].str.strip().fillna("N/A").astype("category")
 
-    ccr = read_table("CCR4500.csv")
+    ccr = read_table(CCR_CSV, CCR_COLUMNS)
     ccr = ccr.rename(columns={
         "Scientific Name": "scientific_name",
         "Scientific name": "scientific_name",
@@ -57,27 +169,136 @@ def load_data():
     if "scientific_name" not in ccr.columns:
         raise ValueError(f"CCR4500.csv missing Scientific Name column. Found: {list(ccr.columns)}")
 
-    ccr_set = set(ccr["scientific_name"].astype(str).str.strip().str.lower())
-    return ratings, ccr_set
+    ccr_set = frozenset(_norm_series(ccr["scientific_name"].dropna())) - HEADER_NAME_NORMS
+
+    # Common-name -> record lookup built from the column arrays (first row wins, like iloc[0])
+    by_name = {}
+    for key, sci, sci_norm, rating in zip(
+        ratings["common_name_norm"].to_numpy(),
+        ratings["scientific_name"].to_numpy(),
+        ratings["scientific_name_norm"].to_numpy(),
+        ratings["rating"].to_numpy(),
+    ):
+        by_name.setdefault(key, {"scientific_name": sci, "scientific_name_norm": sci_norm, "rating": rating})
 
-RATINGS_DF, CCR_SET = load_data()
+    return ratings, ccr_set, by_name
+
+def load_data():
+    return _load_data_cached(os.path.getmtime(RATINGS_CSV), os.path.getmtime(CCR_CSV))
+
+# Warm the cache at startup so the first request skips CSV parsing and bad CSVs fail fast
+load_data()
 
 # -----------------------------------
-# Selenium page fetch (like your old code)
+# Page fetch: pooled HTTP for static hosts, Selenium for the rest
 # -----------------------------------
-def get_page_text(url: str) -> str:
+# Elements whose text is not page content
+NON_TEXT_TAGS = ["script", "style", "noscript"]
+
+if LexborHTMLParser is None:
+    import lxml.etree
+    import lxml.html
+
+    # Compiled once for the fallback parser
+    _NON_TEXT_XPATH = lxml.etree.XPath("|".join(f"//{t}" for t in NON_TEXT_TAGS))
+
+def fetch_page_text(url: str) -> str:
+    r = SESSION.get(url, timeout=20)
+    r.raise_for_status()
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(r.text)
+        tree.strip_tags(NON_TEXT_TAGS)
+        # Separate neighbouring elements, then collapse runs of whitespace
+        return " ".join(tree.body.text(separator=" ").split()) if tree.body is not None else ""
+
+    doc = lxml.html.fromstring(r.content)
+    for el in _NON_TEXT_XPATH(doc):
+        el.drop_tree()
+    # Body only, like Selenium's body text (the <title> repeats the search terms)
+    body = doc.find("body")
+    return " ".join(" ".join(body.itertext()).split()) if body is not None else ""
+
+# Small pool of headless Chromes shared by all requests (booting one costs seconds)
+DRIVER_POOL_SIZE = 2
+
+_driver_slots = threading.BoundedSemaphore(DRIVER_POOL_SIZE)
+_idle_drivers = queue.LifoQueue()
+_live_drivers = set()
+
+def _new_driver():
     options = webdriver.ChromeOptions()
     options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
-
     driver = webdriver.Chrome(options=options)
-    driver.get(url)
-    time.sleep(2)  # keep 2 sec for reliability
+    _live_drivers.add(driver)
+    return driver
+
+def _quit_driver(driver):
+    _live_drivers.discard(driver)
+    try:
+        driver.quit()
+    except Exception:
+        # A dead chromedriver fails here too; it is gone either way
+        pass
 
-    text = driver.find_element(By.TAG_NAME, "body").text
-    driver.quit()
-    return text
+def _quit_all_drivers():
+    for driver in list(_live_drivers):
+        _quit_driver(driver)
+
+atexit.register(_quit_all_drivers)
+
+def selenium_page_text(url: str) -> str:
+    with _driver_slots:
+        try:
+            driver = _idle_drivers.get_nowait()
+        except queue.Empty:
+            driver = _new_driver()
+        try:
+            driver.get(url)
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            text = driver.find_element(By.TAG_NAME, "body").text
+        except TimeoutException:
+            # A slow page, not a broken browser: keep the driver
+            _idle_drivers.put(driver)
+            raise
+        except Exception:
+            # Drop a broken browser so the next call starts a fresh one
+            _quit_driver(driver)
+            raise
+        _idle_drivers.put(driver)
+        return text
+
+# Page text is reused for 5 minutes, so repeat checks skip the network entirely
+_page_cache = TTLCache(maxsize=1024, ttl=300)
+_page_cache_lock = threading.RLock()
+
+@cached(_page_cache, lock=_page_cache_lock)
+def get_page_text(url: str) -> str:
+    host = urlparse(url).hostname
+    throttle_host(host)
+    if host in STATIC_HOSTS:
+        return fetch_page_text(url)
+    return selenium_page_text(url)
+
+# One worker pool for page checks, shared across requests
+CHECK_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="page-check")
+
+def check_page(url: str, needle: str) -> dict:
+    # needle is the already lower-cased query
+    try:
+        page_text = get_page_text(url)
+        return {
+            "url": url,
+            "present": needle in page_text.lower(),
+            "status": "OK",
+        }
+    except Exception as e:
+        return {
+            "url": url,
+            "present": False,
+            "status": f"ERROR: {type(e).__name__}",
+        }
 
 # -----------------------------------
 # Main Route
@@ -96,37 +317,25 @@ def index():
             error = "Please enter a plant name."
             return render_template("index.html", query=query, result=result, checks=checks, error=error, pages=PAGES)
 
+        _, ccr_set, by_name = load_data()
+
         # Lookup in your database (exact match, fastest)
-        hit = RATINGS_DF[RATINGS_DF["common_name"].str.lower() == query.lower()]
+        row = by_name.get(norm(query))
 
         sci = ""
         rating = "N/A"
         is_ccr = False
         found_in_db = False
 
-        if not hit.empty:
-            row = hit.iloc[0]
+        if row is not None:
             found_in_db = True
-            sci = row.get("scientific_name", "")
-            rating = row.get("rating", "N/A")
-            is_ccr = sci.strip().lower() in CCR_SET if sci else False
-
-        # Check presence across the hardcoded pages
-        for url in PAGES:
-            try:
-                page_text = get_page_text(url)
-                present = query.lower() in page_text.lower()
-                checks.append({
-                    "url": url,
-                    "present": present,
-                    "status": "OK",
-                })
-            except Exception as e:
-                checks.append({
-                    "url": url,
-                    "present": False,
-                    "status": f"ERROR: {type(e).__name__}",
-                })
+            sci = row["scientific_name"]
+            rating = row["rating"]
+            is_ccr = bool(sci) and row["scientific_name_norm"] in ccr_set
+
+        # Check presence across the hardcoded pages (in parallel, results keep PAGES order)
+        needle = query.lower()
+        checks = list(CHECK_POOL.map(lambda url: check_page(url, needle), PAGES))
 
         result = {
             "common_name": query,
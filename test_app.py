@@ -0,0 +1,20 @@
+import pandas as pd
+import pytest
+
+from app import STR_DTYPE, _norm_series, load_data, norm
+
+
+def test_repeated_header_line_is_not_loaded_as_a_species():
+    # Rating.csv repeats a "scientific_name\tcommon_name\trating" header mid-file
+    ratings, ccr_set, by_name = load_data()
+    assert "common_name" not in by_name
+    assert "rating" not in ratings["rating"].cat.categories
+    assert "scientific_name" not in ccr_set
+    assert "alligatorweed" in by_name
+
+
+@pytest.mark.parametrize("dtype", sorted({"string", STR_DTYPE}))
+def test_norm_series_matches_norm(dtype):
+    # The common-name lookup keys on _norm_series(column) == norm(query)
+    names = ["Alligator weed", "  Sea\tmyrtle ", "Ward’s  weed", "Giant  ragweed", ""]
+    assert list(_norm_series(pd.Series(names, dtype=dtype))) == [norm(n) for n in names]